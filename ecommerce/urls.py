@@ -18,10 +18,11 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from store.utils.urls import cached_include
 
 urlpatterns = [
     path('django-admin/', admin.site.urls),  # Renamed default admin
-    path('admin/', include('store.admin_urls')),  # Custom admin panel
+    cached_include('admin/', 'store.admin_urls'),  # Custom admin panel
     path('', include('store.urls')),
 ]
 
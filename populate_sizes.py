@@ -5,19 +5,20 @@ Script to populate the Size model with default clothing sizes
 
 import os
 import sys
-import django
 
 # Add the project directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Set up Django environment
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ecommerce.settings')
-django.setup()
-
-from store.models import Size
+def setup_django():
+    """Set up Django environment; deferred until the script actually runs"""
+    import django
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ecommerce.settings')
+    django.setup()
 
 def populate_sizes():
     """Create default clothing sizes"""
+    from django.db import transaction
+    from store.models import Size
     
     sizes_data = [
         {'name': 'XS', 'description': 'Extra Small', 'sort_order': 1},
@@ -31,22 +32,20 @@ def populate_sizes():
     
     print("Creating default clothing sizes...")
     
-    for size_data in sizes_data:
-        size, created = Size.objects.get_or_create(
-            name=size_data['name'],
-            defaults={
-                'description': size_data['description'],
-                'sort_order': size_data['sort_order']
-            }
-        )
-        
-        if created:
-            print(f"✓ Created size: {size.name} ({size.description})")
-        else:
-            print(f"- Size already exists: {size.name} ({size.description})")
+    with transaction.atomic():
+        existing = set(Size.objects.values_list('name', flat=True))
+        to_create = [Size(**size_data) for size_data in sizes_data if size_data['name'] not in existing]
+        Size.objects.bulk_create(to_create, batch_size=100, ignore_conflicts=True)
     
-    print(f"\nTotal sizes in database: {Size.objects.count()}")
-    print("Size population completed!")
+    lines = [
+        f"- Size already exists: {d['name']} ({d['description']})" if d['name'] in existing
+        else f"✓ Created size: {d['name']} ({d['description']})"
+        for d in sizes_data
+    ]
+    lines.append(f"\nTotal sizes in database: {Size.objects.count()}")
+    lines.append("Size population completed!")
+    print("\n".join(lines))
 
 if __name__ == '__main__':
+    setup_django()
     populate_sizes()
\ No newline at end of file
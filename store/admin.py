@@ -9,12 +9,170 @@ from .models import (
     UserProfile, Order, OrderItem, Wishlist, UserMessage, Cart, CartItem, OrderStatusHistory, ContactMessage, UserMessageReply, Rating
 )
 from django.utils.html import format_html
-from django.urls import reverse, path
+from django.utils.safestring import mark_safe
+from django.template.loader import render_to_string
+from django.urls import reverse, path, get_script_prefix
 from django.contrib import messages
 from django.http import HttpResponseRedirect
 from django.contrib.admin.views.decorators import staff_member_required
+from django.contrib.admin.views.main import ChangeList
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.db import connections, transaction
+from django.db.models import (
+    Count, Sum, Case, When, F, Q, ExpressionWrapper, BooleanField, PositiveIntegerField,
+    Prefetch, prefetch_related_objects
+)
+from django.db.models.functions import Coalesce
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from collections import defaultdict
+from functools import lru_cache
+import re
+from .utils.bulk import bulk_insert
+from .utils.pagination import FasterAdminPaginator
+
+# Built once at import instead of on every row/save
+_STATUS_DISPLAY = Order.STATUS_DISPLAY
+_STATUS_COLORS = {
+    'pending': 'gray',
+    'processing': 'blue',
+    'packed': 'purple',
+    'shipped': 'orange',
+    'out_for_delivery': 'teal',
+    'delivered': 'green',
+    'cancelled': 'red'
+}
+# Customer notifications for status changes made from the order change form
+_STATUS_MESSAGES = {
+    'pending': 'Your order has been received and is pending processing.',
+    'processing': 'Great news! Your order #{} is now being processed. Our team is working on preparing your items.',
+    'packed': 'Your order #{} has been carefully packed and is ready for shipping! It will be handed over to our delivery partner soon.',
+    'shipped': 'Your order #{} has been shipped! Your package is on its way to you. You can track its journey in your account.',
+    'out_for_delivery': 'Exciting news! Your order #{} is out for delivery today. Please ensure someone is available to receive it.',
+    'delivered': 'Your order #{} has been delivered. We hope you love your purchase! Please confirm receipt in your account.',
+    'cancelled': 'Your order #{} has been cancelled as requested. If you have any questions, please contact our customer support.'
+}
+_STATUS_MESSAGE_LEVELS = {
+    'pending': messages.INFO,
+    'processing': messages.INFO,
+    'packed': messages.INFO,
+    'shipped': messages.SUCCESS,
+    'out_for_delivery': messages.SUCCESS,
+    'delivered': messages.SUCCESS,
+}
+# Admin status transitions: the statuses an order may move from (None means any
+# order that isn't delivered or cancelled yet), plus its history label and customer message
+_STATUS_TRANSITIONS = {
+    'processing': {
+        'from': ('pending',),
+        'label': 'Processing',
+        'message': _STATUS_MESSAGES['processing'],
+        'level': _STATUS_MESSAGE_LEVELS['processing'],
+    },
+    'packed': {
+        'from': ('processing',),
+        'label': 'Packed',
+        'message': _STATUS_MESSAGES['packed'],
+        'level': _STATUS_MESSAGE_LEVELS['packed'],
+    },
+    'shipped': {
+        'from': ('processing', 'packed'),
+        'label': 'Shipped',
+        'message': _STATUS_MESSAGES['shipped'],
+        'level': _STATUS_MESSAGE_LEVELS['shipped'],
+    },
+    'out_for_delivery': {
+        'from': ('shipped',),
+        'label': 'Out for Delivery',
+        'message': _STATUS_MESSAGES['out_for_delivery'],
+        'level': _STATUS_MESSAGE_LEVELS['out_for_delivery'],
+    },
+    'delivered': {
+        'from': ('shipped', 'out_for_delivery'),
+        'label': 'Delivered',
+        'message': _STATUS_MESSAGES['delivered'],
+        'level': _STATUS_MESSAGE_LEVELS['delivered'],
+    },
+    'cancelled': {
+        'from': None,
+        'label': 'Cancelled',
+        # Bulk cancellations come from the shop, so they don't say "as requested"
+        'message': 'Your order #{} has been cancelled. If you have any questions, please contact our customer support.',
+        'level': messages.WARNING,
+    },
+}
+# Rows streamed and history rows written per round trip by the bulk order actions
+_ACTION_CHUNK_SIZE = 500
+_STATUS_BADGE = '<span style="color: white; background-color: {}; padding: 5px; border-radius: 5px;">{}</span>'
+_VIEW_BUTTON = (
+    '<a href="{}" '
+    'style="display: inline-block; margin: 2px; padding: 5px 10px; background-color: #007cba; '
+    'color: white; text-decoration: none; border-radius: 3px; font-size: 0.9em;" '
+    'title="View order details">'
+    '👁️ View Details</a>'
+)
+
+@lru_cache(maxsize=None)
+def _order_change_path_template():
+    """The order change URL, without the script prefix, with a {} where the pk goes"""
+    url = reverse('admin:store_order_change', args=[0])
+    return url[len(get_script_prefix()):].replace('/0/', '/{}/')
+
+def _order_change_url(pk):
+    # Reversed once per process; the script prefix is per request, so it is added back each time
+    return get_script_prefix() + _order_change_path_template().format(pk)
+
+def _chunks(items, size=_ACTION_CHUNK_SIZE):
+    """Split items into slices small enough to bind in one query"""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def _update_in_chunks(queryset, ids, **values):
+    """UPDATE the rows with these ids chunk by chunk and return how many changed"""
+    return sum(queryset.filter(pk__in=chunk).update(**values) for chunk in _chunks(ids))
+
+def _notify_users_on_commit(user_messages):
+    """Write customer notifications after the order changes commit, outside the critical transaction"""
+    if user_messages:
+        transaction.on_commit(
+            lambda: bulk_insert(UserMessage, user_messages, batch_size=_ACTION_CHUNK_SIZE),
+            robust=True
+        )
+
+class FullTextSearchMixin:
+    """
+    Admin search backed by PostgreSQL full-text search over search_vector_fields
+    
+    Each search word is matched as a prefix so autocomplete keeps working while
+    typing. The SearchVector must stay in step with the expression indexes
+    created in the store migrations for the planner to use them. Other database
+    backends use the regular search_fields lookups.
+    """
+    search_vector_fields = ()
+    search_config = 'english'
+    
+    def get_search_results(self, request, queryset, search_term):
+        words = re.findall(r'\w+', search_term)
+        if not words or connections[queryset.db].vendor != 'postgresql':
+            return super().get_search_results(request, queryset, search_term)
+        
+        query = SearchQuery(
+            ' & '.join(f'{word}:*' for word in words), config=self.search_config, search_type='raw'
+        )
+        vector = SearchVector(*self.search_vector_fields, config=self.search_config)
+        return queryset.alias(_search=vector).filter(_search=query), False
+
+class OnlyFieldsChangeList(ChangeList):
+    """
+    Changelist that only loads the model admin's list_only_fields
+    
+    Kept off get_queryset so the change form, which reads and saves every
+    field, still gets fully loaded objects.
+    """
+    
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.only(*self.model_admin.list_only_fields)
 
 class ProductAdminForm(forms.ModelForm):
     class Meta:
@@ -36,12 +194,18 @@ class ProductSizeInline(admin.TabularInline):
     fields = ('size', 'stock')
     verbose_name = 'Size'
     verbose_name_plural = 'Available Sizes'
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('size', 'product')
 
 class OrderItemInline(admin.TabularInline):
     model = OrderItem
     extra = 0
     readonly_fields = ('product', 'quantity', 'price', 'subtotal')
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('product')
+    
     def has_add_permission(self, request, obj=None):
         return False
     
@@ -59,15 +223,22 @@ class UserAdmin(BaseUserAdmin):
     list_filter = ('is_staff', 'is_superuser', 'is_active', 'date_joined')
     search_fields = ('username', 'first_name', 'last_name', 'email')
     ordering = ('-date_joined',)
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('userprofile')
 
 @admin.register(Product)
-class ProductAdmin(admin.ModelAdmin):
+class ProductAdmin(FullTextSearchMixin, admin.ModelAdmin):
     form = ProductAdminForm
     inlines = [ProductSizeInline]
     list_display = ('name', 'category', 'season', 'price', 'total_stock_display', 'featured', 'created_at')
     list_filter = ('category', 'season', 'featured', 'sizes')
     search_fields = ('name', 'description', 'tags')
+    search_vector_fields = ('name', 'description', 'tags')
     readonly_fields = ('created_at', 'updated_at', 'total_stock')
+    autocomplete_fields = ('category', 'season')
     
     fieldsets = (
         ('Product Information', {
@@ -86,10 +257,16 @@ class ProductAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _total_stock=Coalesce(Sum('product_sizes__stock'), 0)
+        )
+    
     def total_stock_display(self, obj):
         """Display total stock across all sizes"""
-        return obj.total_stock
+        return obj._total_stock
     total_stock_display.short_description = 'Total Stock'
+    total_stock_display.admin_order_field = '_total_stock'
     
     def save_model(self, request, obj, form, change):
         """Validate price is not negative"""
@@ -173,21 +350,33 @@ class SeasonAdmin(admin.ModelAdmin):
 class WishlistAdmin(admin.ModelAdmin):
     list_display = ('user', 'product_count', 'created_at')
     search_fields = ('user__username', 'user__email')
+    list_select_related = ('user',)
     filter_horizontal = ('products',)
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(_product_count=Count('products'))
+    
     def product_count(self, obj):
-        return obj.products.count()
+        return obj._product_count
     product_count.short_description = 'Number of Products'
+    product_count.admin_order_field = '_product_count'
 
 @admin.register(UserMessage)
 class UserMessageAdmin(admin.ModelAdmin):
     list_display = ('user', 'message', 'level', 'created_at', 'read')
     list_filter = ('level', 'read', 'created_at')
     search_fields = ('user__username', 'user__email', 'message')
+    list_select_related = ('user',)
+    list_only_fields = ('user__username', 'message', 'level', 'created_at', 'read')
     list_per_page = 20
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
     
     actions = ['mark_as_read']
     
+    def get_changelist(self, request, **kwargs):
+        return OnlyFieldsChangeList
+    
     def mark_as_read(self, request, queryset):
         updated = queryset.update(read=True)
         self.message_user(request, f'{updated} message(s) marked as read.')
@@ -199,7 +388,10 @@ class OrderStatusHistoryAdmin(admin.ModelAdmin):
     list_filter = ('status', 'created_at')
     search_fields = ('order__id', 'order__full_name', 'created_by__username', 'notes')
     readonly_fields = ('order', 'status', 'created_by', 'created_at', 'notes')
+    list_select_related = ('order', 'created_by')
     list_per_page = 20
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
     
     def has_add_permission(self, request):
         return False
@@ -212,11 +404,20 @@ class OrderStatusHistoryAdmin(admin.ModelAdmin):
 
 @admin.register(Order)
 class OrderAdmin(admin.ModelAdmin):
-    list_display = ('id', 'full_name', 'user', 'total_amount', 'status_colored', 'payment_method', 
+    list_display = ('id', 'full_name', 'user', 'item_count', 'total_amount', 'status_colored', 'payment_method', 
                   'payment_status', 'created_at', 'action_buttons')
     list_filter = ('status', 'payment_method', 'payment_status', 'created_at')
     search_fields = ('full_name', 'email', 'phone', 'user__username', 'user__email')
     readonly_fields = ('created_at', 'updated_at', 'status_history_display')
+    list_select_related = ('user',)
+    list_per_page = 50
+    list_only_fields = (
+        'id', 'full_name', 'user__username', 'user__email', 'total_amount', 'status',
+        'payment_method', 'payment_status', 'created_at'
+    )
+    autocomplete_fields = ('user',)
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
     inlines = [OrderItemInline]
     # Removed bulk actions - use order details page for status updates
     actions = []
@@ -248,6 +449,35 @@ class OrderAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user').annotate(
+            _item_count=Count('items')
+        )
+    
+    def get_changelist(self, request, **kwargs):
+        return OnlyFieldsChangeList
+    
+    def item_count(self, obj):
+        return obj._item_count
+    item_count.short_description = 'Items'
+    item_count.admin_order_field = '_item_count'
+    
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'user':
+            # The customer dropdown only needs the username for its labels
+            kwargs['queryset'] = User.objects.only('id', 'username', 'email').order_by('username')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+    
+    def get_object(self, request, object_id, from_field=None):
+        obj = super().get_object(request, object_id, from_field)
+        if obj is not None:
+            # Only the change form shows the history, so prefetch it here rather than in get_queryset
+            prefetch_related_objects([obj], Prefetch(
+                'status_history',
+                queryset=OrderStatusHistory.objects.select_related('created_by').order_by('-created_at')
+            ))
+        return obj
+    
     def get_urls(self):
         urls = super().get_urls()
         custom_urls = [
@@ -262,25 +492,12 @@ class OrderAdmin(admin.ModelAdmin):
     
     def process_status_update(self, request, object_id, status):
         """Process a status update from the change form button"""
-        order = get_object_or_404(Order, pk=object_id)
-        
-        # Map status to action function
-        status_actions = {
-            'processing': self.mark_as_processing,
-            'packed': self.mark_as_packed,
-            'shipped': self.mark_as_shipped,
-            'out_for_delivery': self.mark_as_out_for_delivery,
-            'delivered': self.mark_as_delivered,
-            'cancelled': self.mark_as_cancelled
-        }
+        get_object_or_404(Order.objects.only('id'), pk=object_id)
         
-        # Get the action function
-        action_func = status_actions.get(status)
-        if action_func:
-            # Create a queryset with just this order
-            queryset = Order.objects.filter(pk=object_id)
-            # Call the action function
-            action_func(request, queryset)
+        transition = _STATUS_TRANSITIONS.get(status)
+        if transition:
+            updated = self._apply_status_transition(request, Order.objects.filter(pk=object_id), status)
+            self.message_user(request, f"{updated} order(s) marked as {transition['label'].lower()}.")
         
         return HttpResponseRedirect(
             reverse('admin:store_order_change', args=[object_id])
@@ -299,19 +516,9 @@ class OrderAdmin(admin.ModelAdmin):
     
     def status_colored(self, obj):
         """Display status with color coding"""
-        status_colors = {
-            'pending': 'gray',
-            'processing': 'blue',
-            'packed': 'purple',
-            'shipped': 'orange',
-            'out_for_delivery': 'teal',
-            'delivered': 'green',
-            'cancelled': 'red'
-        }
-        color = status_colors.get(obj.status, 'black')
         return format_html(
-            '<span style="color: white; background-color: {}; padding: 5px; border-radius: 5px;">{}</span>',
-            color, obj.get_status_display()
+            _STATUS_BADGE,
+            _STATUS_COLORS.get(obj.status, 'black'), _STATUS_DISPLAY.get(obj.status, obj.status)
         )
     status_colored.short_description = "Status"
     status_colored.admin_order_field = 'status'
@@ -325,277 +532,185 @@ class OrderAdmin(admin.ModelAdmin):
         if not history:
             return "No status changes recorded"
         
-        html = '<table style="width:100%; border-collapse: collapse;">'
-        html += '<tr><th style="border:1px solid #ddd; padding:8px; text-align:left;">Date</th>'
-        html += '<th style="border:1px solid #ddd; padding:8px; text-align:left;">Status</th>'
-        html += '<th style="border:1px solid #ddd; padding:8px; text-align:left;">By</th>'
-        html += '<th style="border:1px solid #ddd; padding:8px; text-align:left;">Notes</th></tr>'
-        
-        for entry in history:
-            html += f'<tr>'
-            html += f'<td style="border:1px solid #ddd; padding:8px;">{entry.created_at.strftime("%Y-%m-%d %H:%M")}</td>'
-            html += f'<td style="border:1px solid #ddd; padding:8px;">{entry.get_status_display()}</td>'
-            html += f'<td style="border:1px solid #ddd; padding:8px;">{entry.created_by.username if entry.created_by else "System"}</td>'
-            html += f'<td style="border:1px solid #ddd; padding:8px;">{entry.notes}</td>'
-            html += f'</tr>'
-        
-        html += '</table>'
-        return format_html(html)
+        return mark_safe(render_to_string('admin/store/order/status_history.html', {'history': history}))
     status_history_display.short_description = "Status History"
     
     def save_model(self, request, obj, form, change):
         if change and 'status' in form.changed_data:
-            old_obj = Order.objects.get(pk=obj.pk)
-            if old_obj.status != obj.status:
+            old_status = form.initial.get('status')
+            if old_status != obj.status:
                 # Create status history entry
                 OrderStatusHistory.objects.create(
                     order=obj,
                     status=obj.status,
                     created_by=request.user,
-                    notes=f"Status changed from {dict(Order.STATUS_CHOICES).get(old_obj.status)} to {dict(Order.STATUS_CHOICES).get(obj.status)}"
+                    notes=f"Status changed from {_STATUS_DISPLAY.get(old_status)} to {_STATUS_DISPLAY.get(obj.status)}"
                 )
                 
                 # Create user notification
-                status_messages = {
-                    'pending': 'Your order has been received and is pending processing.',
-                    'processing': 'Great news! Your order #{} is now being processed. Our team is working on preparing your items.',
-                    'packed': 'Your order #{} has been carefully packed and is ready for shipping! It will be handed over to our delivery partner soon.',
-                    'shipped': 'Your order #{} has been shipped! Your package is on its way to you. You can track its journey in your account.',
-                    'out_for_delivery': 'Exciting news! Your order #{} is out for delivery today. Please ensure someone is available to receive it.',
-                    'delivered': 'Your order #{} has been delivered. We hope you love your purchase! Please confirm receipt in your account.',
-                    'cancelled': 'Your order #{} has been cancelled as requested. If you have any questions, please contact our customer support.'
-                }
-                message_template = status_messages.get(obj.status, f'Your order #{obj.id} status has been updated to {obj.get_status_display()}.')
+                message_template = _STATUS_MESSAGES.get(obj.status, f'Your order #{obj.id} status has been updated to {obj.get_status_display()}.')
                 message = message_template.format(obj.id)
                 
-                if obj.user:
-                    UserMessage.objects.create(
-                        user=obj.user,
+                if obj.user_id:
+                    _notify_users_on_commit([UserMessage(
+                        user_id=obj.user_id,
                         message=message,
-                        level=messages.INFO if obj.status in ['pending', 'processing', 'packed'] else 
-                              messages.SUCCESS if obj.status in ['shipped', 'out_for_delivery', 'delivered'] else
-                              messages.WARNING
-                    )
+                        level=_STATUS_MESSAGE_LEVELS.get(obj.status, messages.WARNING)
+                    )])
         super().save_model(request, obj, form, change)
     
-    def mark_as_processing(self, request, queryset):
-        # Get orders that will be updated before updating them
-        orders_to_update = list(queryset.filter(status='pending'))
-        updated = queryset.filter(status='pending').update(status='processing')
+    def _apply_status_transition(self, request, queryset, new_status):
+        """Move the eligible orders in queryset to new_status, recording history and notifying users"""
+        transition = _STATUS_TRANSITIONS[new_status]
+        
+        if transition['from'] is None:
+            eligible = queryset.exclude(status__in=('delivered', 'cancelled'))
+        else:
+            eligible = queryset.filter(status__in=transition['from'])
         
-        for order in orders_to_update:
-            # Refresh the order from database to get updated status
-            order.refresh_from_db()
+        with transaction.atomic():
+            # Stream just the columns we need so large selections stay bounded in memory
+            rows = eligible.values_list('id', 'user_id').iterator(chunk_size=_ACTION_CHUNK_SIZE)
             
-            # Create status history
-            OrderStatusHistory.objects.create(
-                order=order,
-                status='processing',
-                created_by=request.user,
-                notes="Status changed to Processing via admin action"
-            )
+            order_ids = []
+            histories = []
+            user_messages = []
+            for order_id, user_id in rows:
+                order_ids.append(order_id)
+                
+                # Create status history
+                histories.append(OrderStatusHistory(
+                    order_id=order_id,
+                    status=new_status,
+                    created_by=request.user,
+                    notes=f"Status changed to {transition['label']} via admin action"
+                ))
+                if len(histories) >= _ACTION_CHUNK_SIZE:
+                    bulk_insert(OrderStatusHistory, histories)
+                    histories = []
+                
+                # Notify user
+                if user_id:
+                    user_messages.append(UserMessage(
+                        user_id=user_id,
+                        message=transition['message'].format(order_id),
+                        level=transition['level']
+                    ))
             
-            # Notify user
-            if order.user:
-                UserMessage.objects.create(
-                    user=order.user,
-                    message=f'Great news! Your order #{order.id} is now being processed. Our team is working on preparing your items.',
-                    level=messages.INFO
-                )
+            bulk_insert(OrderStatusHistory, histories)
+            # Chunked so each IN list stays under SQLite's bound-parameter limit
+            updated = _update_in_chunks(Order.objects, order_ids, status=new_status)
+            
+            if new_status == 'cancelled':
+                self._restock_order_items(order_ids)
+            
+            _notify_users_on_commit(user_messages)
+        return updated
+    
+    def _restock_order_items(self, order_ids):
+        """Return items to inventory with one UPDATE per chunk of affected products"""
+        restock = defaultdict(int)
+        for chunk in _chunks(order_ids):
+            items = OrderItem.objects.filter(
+                order_id__in=chunk, product_id__isnull=False
+            ).values_list('product_id', 'quantity')
+            for product_id, quantity in items:
+                restock[product_id] += quantity
+        now = timezone.now()
+        # Each product binds three parameters (two in its WHEN, one in the IN list)
+        for chunk in _chunks(list(restock.items()), _ACTION_CHUNK_SIZE // 3):
+            Product.objects.filter(pk__in=[product_id for product_id, _ in chunk]).update(
+                stock=Case(
+                    *[When(pk=product_id, then=F('stock') + quantity) for product_id, quantity in chunk],
+                    output_field=PositiveIntegerField()
+                ),
+                updated_at=now
+            )
+    
+    def mark_as_processing(self, request, queryset):
+        updated = self._apply_status_transition(request, queryset, 'processing')
         self.message_user(request, f'{updated} order(s) marked as processing.')
     mark_as_processing.short_description = "Mark selected orders as processing"
     
     def mark_as_packed(self, request, queryset):
-        # Get orders that will be updated before updating them
-        orders_to_update = list(queryset.filter(status='processing'))
-        updated = queryset.filter(status='processing').update(status='packed')
-        
-        for order in orders_to_update:
-            # Refresh the order from database to get updated status
-            order.refresh_from_db()
-            
-            # Create status history
-            OrderStatusHistory.objects.create(
-                order=order,
-                status='packed',
-                created_by=request.user,
-                notes="Status changed to Packed via admin action"
-            )
-            
-            # Notify user
-            if order.user:
-                UserMessage.objects.create(
-                    user=order.user,
-                    message=f'Your order #{order.id} has been carefully packed and is ready for shipping! It will be handed over to our delivery partner soon.',
-                    level=messages.INFO
-                )
+        updated = self._apply_status_transition(request, queryset, 'packed')
         self.message_user(request, f'{updated} order(s) marked as packed.')
     mark_as_packed.short_description = "Mark selected orders as packed"
     
     def mark_as_shipped(self, request, queryset):
-        # Get orders that will be updated before updating them
-        orders_to_update = list(queryset.filter(status__in=['processing', 'packed']))
-        updated = queryset.filter(status__in=['processing', 'packed']).update(status='shipped')
-        
-        for order in orders_to_update:
-            # Refresh the order from database to get updated status
-            order.refresh_from_db()
-            
-            # Create status history
-            OrderStatusHistory.objects.create(
-                order=order,
-                status='shipped',
-                created_by=request.user,
-                notes="Status changed to Shipped via admin action"
-            )
-            
-            # Notify user
-            if order.user:
-                UserMessage.objects.create(
-                    user=order.user,
-                    message=f'Your order #{order.id} has been shipped! Your package is on its way to you. You can track its journey in your account.',
-                    level=messages.SUCCESS
-                )
+        updated = self._apply_status_transition(request, queryset, 'shipped')
         self.message_user(request, f'{updated} order(s) marked as shipped.')
     mark_as_shipped.short_description = "Mark selected orders as shipped"
     
     def mark_as_out_for_delivery(self, request, queryset):
-        # Get orders that will be updated before updating them
-        orders_to_update = list(queryset.filter(status='shipped'))
-        updated = queryset.filter(status='shipped').update(status='out_for_delivery')
-        
-        for order in orders_to_update:
-            # Refresh the order from database to get updated status
-            order.refresh_from_db()
-            
-            # Create status history
-            OrderStatusHistory.objects.create(
-                order=order,
-                status='out_for_delivery',
-                created_by=request.user,
-                notes="Status changed to Out for Delivery via admin action"
-            )
-            
-            # Notify user
-            if order.user:
-                UserMessage.objects.create(
-                    user=order.user,
-                    message=f'Exciting news! Your order #{order.id} is out for delivery today. Please ensure someone is available to receive it.',
-                    level=messages.SUCCESS
-                )
+        updated = self._apply_status_transition(request, queryset, 'out_for_delivery')
         self.message_user(request, f'{updated} order(s) marked as out for delivery.')
     mark_as_out_for_delivery.short_description = "Mark selected orders as out for delivery"
     
     def mark_as_delivered(self, request, queryset):
-        # Get orders that will be updated before updating them
-        orders_to_update = list(queryset.filter(status__in=['shipped', 'out_for_delivery']))
-        updated = queryset.filter(status__in=['shipped', 'out_for_delivery']).update(status='delivered')
-        
-        for order in orders_to_update:
-            # Refresh the order from database to get updated status
-            order.refresh_from_db()
-            
-            # Create status history
-            OrderStatusHistory.objects.create(
-                order=order,
-                status='delivered',
-                created_by=request.user,
-                notes="Status changed to Delivered via admin action"
-            )
-            
-            # Notify user
-            if order.user:
-                UserMessage.objects.create(
-                    user=order.user,
-                    message=f'Your order #{order.id} has been delivered. We hope you love your purchase! Please confirm receipt in your account.',
-                    level=messages.SUCCESS
-                )
+        updated = self._apply_status_transition(request, queryset, 'delivered')
         self.message_user(request, f'{updated} order(s) marked as delivered.')
     mark_as_delivered.short_description = "Mark selected orders as delivered"
     
     def mark_as_paid(self, request, queryset):
-        # Get orders that will be updated before updating them
-        orders_to_update = list(queryset.filter(payment_status=False))
-        updated = queryset.update(payment_status=True)
-        
-        for order in orders_to_update:
-            # Refresh the order from database to get updated payment status
-            order.refresh_from_db()
+        with transaction.atomic():
+            # Stream just the columns we need so large selections stay bounded in memory
+            rows = queryset.filter(payment_status=False).values_list(
+                'id', 'user_id', 'status'
+            ).iterator(chunk_size=_ACTION_CHUNK_SIZE)
             
-            # Create note in status history
-            OrderStatusHistory.objects.create(
-                order=order,
-                status=order.status,
-                created_by=request.user,
-                notes="Payment marked as received via admin action"
-            )
+            order_ids = []
+            histories = []
+            user_messages = []
+            for order_id, user_id, status in rows:
+                order_ids.append(order_id)
+                
+                # Create note in status history
+                histories.append(OrderStatusHistory(
+                    order_id=order_id,
+                    status=status,
+                    created_by=request.user,
+                    notes="Payment marked as received via admin action"
+                ))
+                if len(histories) >= _ACTION_CHUNK_SIZE:
+                    bulk_insert(OrderStatusHistory, histories)
+                    histories = []
+                
+                # Notify user
+                if user_id:
+                    user_messages.append(UserMessage(
+                        user_id=user_id,
+                        message=f'Thank you! Payment for order #{order_id} has been received. Your purchase is confirmed!',
+                        level=messages.SUCCESS
+                    ))
             
-            # Notify user
-            if order.user:
-                UserMessage.objects.create(
-                    user=order.user,
-                    message=f'Thank you! Payment for order #{order.id} has been received. Your purchase is confirmed!',
-                    level=messages.SUCCESS
-                )
+            bulk_insert(OrderStatusHistory, histories)
+            updated = _update_in_chunks(Order.objects, order_ids, payment_status=True)
+            _notify_users_on_commit(user_messages)
         self.message_user(request, f'Payment status updated for {updated} order(s).')
     mark_as_paid.short_description = "Mark selected orders as paid"
     
     def mark_as_cancelled(self, request, queryset):
-        """Mark orders as cancelled"""
-        # Get orders that will be updated before updating them
-        orders_to_update = list(queryset.exclude(status__in=['delivered', 'cancelled']))
-        updated = queryset.exclude(status__in=['delivered', 'cancelled']).update(status='cancelled')
-        
-        for order in orders_to_update:
-            # Refresh the order from database to get updated status
-            order.refresh_from_db()
-            
-            # Create status history
-            OrderStatusHistory.objects.create(
-                order=order,
-                status='cancelled',
-                created_by=request.user,
-                notes="Status changed to Cancelled via admin action"
-            )
-            
-            # Return items to inventory
-            for item in order.items.all():
-                if item.product:
-                    item.product.stock += item.quantity
-                    item.product.save()
-            
-            # Notify user
-            if order.user:
-                UserMessage.objects.create(
-                    user=order.user,
-                    message=f'Your order #{order.id} has been cancelled. If you have any questions, please contact our customer support.',
-                    level=messages.WARNING
-                )
+        updated = self._apply_status_transition(request, queryset, 'cancelled')
         self.message_user(request, f'{updated} order(s) marked as cancelled.')
     mark_as_cancelled.short_description = "Mark selected orders as cancelled"
     
     def action_buttons(self, obj):
         """Display view button to navigate to order details page"""
         # Only show view/eye icon that leads to order details page
-        url = reverse('admin:store_order_change', args=[obj.pk])
-        button = (
-            f'<a href="{url}" '
-            f'style="display: inline-block; margin: 2px; padding: 5px 10px; background-color: #007cba; '
-            f'color: white; text-decoration: none; border-radius: 3px; font-size: 0.9em;" '
-            f'title="View order details">'
-            f'👁️ View Details</a>'
-        )
-        return format_html(button)
+        return format_html(_VIEW_BUTTON, _order_change_url(obj.pk))
     
     action_buttons.short_description = "Actions"
     action_buttons.allow_tags = True
 
 
 @admin.register(ContactMessage)
-class ContactMessageAdmin(admin.ModelAdmin):
+class ContactMessageAdmin(FullTextSearchMixin, admin.ModelAdmin):
     list_display = ('name', 'email', 'subject', 'created_at', 'is_replied', 'replied_by')
     list_filter = ('is_replied', 'created_at', 'replied_by')
+    list_select_related = ('replied_by',)
     search_fields = ('name', 'email', 'subject', 'message')
+    search_vector_fields = ('name', 'email', 'subject', 'message')
     readonly_fields = ('name', 'email', 'subject', 'message', 'created_at')
     ordering = ['-created_at']
     
@@ -616,7 +731,11 @@ class ContactMessageAdmin(admin.ModelAdmin):
             obj.is_replied = True
             obj.replied_at = timezone.now()
             obj.replied_by = request.user
-        super().save_model(request, obj, form, change)
+        if change:
+            # The contact details are read-only here, so only the reply columns can change
+            obj.save(update_fields=['is_replied', 'admin_reply', 'replied_at', 'replied_by'])
+        else:
+            super().save_model(request, obj, form, change)
 
 
 @admin.register(UserMessageReply)
@@ -638,12 +757,19 @@ class UserMessageReplyAdmin(admin.ModelAdmin):
     def save_model(self, request, obj, form, change):
         if not change:  # Only set replied_by for new replies
             obj.replied_by = request.user
-        super().save_model(request, obj, form, change)
+        if change and form.changed_data:
+            # Edits only write the columns the admin actually touched
+            obj.save(update_fields=form.changed_data)
+        else:
+            super().save_model(request, obj, form, change)
 
 class CartItemInline(admin.TabularInline):
     model = CartItem
     extra = 0
     readonly_fields = ('product', 'quantity', 'subtotal')
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('product')
 
 @admin.register(Rating)
 class RatingAdmin(admin.ModelAdmin):
@@ -652,14 +778,22 @@ class RatingAdmin(admin.ModelAdmin):
     search_fields = ['user__username', 'product__name', 'review']
     readonly_fields = ['created_at']
     list_per_page = 25
+    list_only_fields = ('rating', 'created_at', 'user__username', 'product__name')
     
     def has_review(self, obj):
-        return bool(obj.review)
+        return obj._has_review
     has_review.boolean = True
     has_review.short_description = 'Has Review'
+    has_review.admin_order_field = '_has_review'
     
     def get_queryset(self, request):
-        return super().get_queryset(request).select_related('user', 'product')
+        # Let the database answer "has a review" so the changelist never loads review text
+        return super().get_queryset(request).select_related('user', 'product').annotate(
+            _has_review=ExpressionWrapper(~Q(review=''), output_field=BooleanField())
+        )
+    
+    def get_changelist(self, request, **kwargs):
+        return OnlyFieldsChangeList
 
 # Re-register UserAdmin
 admin.site.unregister(User)
@@ -1,52 +1,130 @@
-from django.urls import path
-from . import admin_views
+import hashlib
+
+from django.contrib.messages import get_messages
+from django.db.models import Count, Max, Value
+from django.urls import include, register_converter
+from django.views.decorators.http import condition
+from .models import Category, Product, ProductSize, Season
+from .utils.urls import BoundedIntConverter, OrderActionConverter, lazy_view, path
+
+register_converter(BoundedIntConverter, 'bint')
+register_converter(OrderActionConverter, 'order_action')
 
 app_name = 'custom_admin'
 
+
+def _view(name):
+    # admin_views is only imported once one of its pages is requested
+    return lazy_view(f'store.admin_views.{name}')
+
+
+def _catalogue_state():
+    """Row count and latest updated_at of each catalogue table, fetched in one UNION query"""
+    tables = [
+        model.objects.order_by()
+        .annotate(table=Value(model._meta.db_table))
+        .values('table')
+        .annotate(count=Count('pk'), changed=Max('updated_at'))
+        .values_list('table', 'count', 'changed')
+        for model in (Product, ProductSize, Category, Season)
+    ]
+    return sorted(tables[0].union(*tables[1:], all=True), key=lambda row: row[0])
+
+
+def _catalogue_etag(request, *args, **kwargs):
+    """ETag for the catalogue index pages, built from the tables they render"""
+    # Pages carrying flash messages must render them, so never answer those with a 304
+    if request.method not in ('GET', 'HEAD') or not request.user.is_staff or len(get_messages(request)):
+        return None
+    parts = [request.get_full_path(), str(request.user.pk)]
+    parts.extend(f'{table}:{count}:{changed}' for table, count, changed in _catalogue_state())
+    return hashlib.md5('|'.join(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+def _catalogue_view(name):
+    # Conditional GETs are answered with a 304 before the view runs any of its queries
+    return condition(etag_func=_catalogue_etag)(_view(name))
+
+
+# Routes are grouped under one include() per section so a request only walks
+# the patterns of the section whose prefix it matches, and each section's
+# per-object routes share one <bint:pk>/ include so the pk is parsed once.
+# Sections are listed from most to least visited (the catalogue setup pages
+# last), since the resolver tries them in order; keep new sections in that order.
+#
+# Routes without converters are matched by plain string comparison (see
+# store.utils.urls.path), so static pages such as logout never run a regex.
+#
+# Each index page is also served without its trailing slash (named
+# '<name>_slashless', so reverse('<name>') keeps producing the canonical URL)
+# to save the APPEND_SLASH redirect round trip when the address is typed by hand.
 urlpatterns = [
     # Dashboard
-    path('', admin_views.admin_dashboard, name='dashboard'),
-    
-    # Products
-    path('products/', admin_views.admin_products, name='products'),
-    path('products/add/', admin_views.admin_product_add, name='product_add'),
-    path('products/<int:pk>/edit/', admin_views.admin_product_edit, name='product_edit'),
-    path('products/<int:pk>/delete/', admin_views.admin_product_delete, name='product_delete'),
-    
-    # Categories
-    path('categories/', admin_views.admin_categories, name='categories'),
-    path('categories/add/', admin_views.admin_category_add, name='category_add'),
-    path('categories/<int:pk>/edit/', admin_views.admin_category_edit, name='category_edit'),
-    
-    # Seasons
-    path('seasons/', admin_views.admin_seasons, name='seasons'),
-    path('seasons/add/', admin_views.admin_season_add, name='season_add'),
-    path('seasons/<int:pk>/edit/', admin_views.admin_season_edit, name='season_edit'),
-    path('seasons/<int:pk>/delete/', admin_views.admin_season_delete, name='season_delete'),
-    
+    path('', _view('admin_dashboard'), name='dashboard'),
+
     # Orders
-    path('orders/', admin_views.admin_orders, name='orders'),
-    path('orders/<int:pk>/', admin_views.admin_order_detail, name='order_detail'),
-    path('orders/<int:pk>/send-email/', admin_views.admin_send_order_email, name='send_order_email'),
-    path('orders/<int:pk>/invoice/', admin_views.admin_order_invoice, name='order_invoice'),
-    path('orders/<int:pk>/export/', admin_views.admin_export_order, name='export_order'),
+    path('orders', _view('admin_orders'), name='orders_slashless'),
+    path('orders/', include([
+        path('', _view('admin_orders'), name='orders'),
+        path('<bint:pk>/', include([
+            path('', _view('admin_order_detail'), name='order_detail'),
+            path('<order_action:action>/', _view('admin_order_action'), name='order_action'),
+        ])),
+    ])),
+
+    # Products
+    path('products', _catalogue_view('admin_products'), name='products_slashless'),
+    path('products/', include([
+        path('', _catalogue_view('admin_products'), name='products'),
+        path('add/', _view('admin_product_add'), name='product_add'),
+        path('<bint:pk>/', include([
+            path('edit/', _view('admin_product_edit'), name='product_edit'),
+            path('delete/', _view('admin_product_delete'), name='product_delete'),
+        ])),
+    ])),
 
-    
-    # Users
-    path('users/', admin_views.admin_users, name='users'),
-    path('users/add/', admin_views.admin_user_add, name='add_user'),
-    path('users/<int:pk>/', admin_views.admin_user_detail, name='user_detail'),
-    path('users/<int:pk>/edit/', admin_views.admin_user_edit, name='user_edit'),
-    
-    # Admin Profile
-    path('profile/', admin_views.admin_profile, name='profile'),
-    
     # Messages
-    path('messages/', admin_views.admin_messages, name='messages'),
-    
+    path('messages', _view('admin_messages'), name='messages_slashless'),
+    path('messages/', _view('admin_messages'), name='messages'),
+
+    # Users
+    path('users', _view('admin_users'), name='users_slashless'),
+    path('users/', include([
+        path('', _view('admin_users'), name='users'),
+        path('add/', _view('admin_user_add'), name='add_user'),
+        path('<bint:pk>/', include([
+            path('', _view('admin_user_detail'), name='user_detail'),
+            path('edit/', _view('admin_user_edit'), name='user_edit'),
+        ])),
+    ])),
+
     # Analytics
-    path('analytics/', admin_views.admin_analytics, name='analytics'),
-    
+    path('analytics', _view('admin_analytics'), name='analytics_slashless'),
+    path('analytics/', _view('admin_analytics'), name='analytics'),
+
     # Logout
-    path('logout/', admin_views.admin_logout, name='logout'),
-]
\ No newline at end of file
+    path('logout/', _view('admin_logout'), name='logout'),
+
+    # Admin Profile
+    path('profile', _view('admin_profile'), name='profile_slashless'),
+    path('profile/', _view('admin_profile'), name='profile'),
+
+    # Categories
+    path('categories', _catalogue_view('admin_categories'), name='categories_slashless'),
+    path('categories/', include([
+        path('', _catalogue_view('admin_categories'), name='categories'),
+        path('add/', _view('admin_category_add'), name='category_add'),
+        path('<bint:pk>/edit/', _view('admin_category_edit'), name='category_edit'),
+    ])),
+
+    # Seasons
+    path('seasons', _catalogue_view('admin_seasons'), name='seasons_slashless'),
+    path('seasons/', include([
+        path('', _catalogue_view('admin_seasons'), name='seasons'),
+        path('add/', _view('admin_season_add'), name='season_add'),
+        path('<bint:pk>/', include([
+            path('edit/', _view('admin_season_edit'), name='season_edit'),
+            path('delete/', _view('admin_season_delete'), name='season_delete'),
+        ])),
+    ])),
+]
@@ -1,23 +1,27 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
+from django.core.cache import cache
 from django.core.paginator import Paginator
-from django.db.models import Q, Sum, Count
-from django.db.models.functions import TruncMonth
+from django.db import transaction
+from django.db.models import Q, F, Sum, Count, DateField, Prefetch, prefetch_related_objects
+from django.db.models.functions import TruncDate, TruncMonth
 from django.utils import timezone
-from django.http import JsonResponse, HttpResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.core.mail import send_mail
 from django.template.loader import render_to_string
 from django.conf import settings
-from datetime import datetime, timedelta
+from datetime import date, timedelta
 import csv
 import json
 from .models import Product, Category, Season, Order, OrderItem, User, UserProfile, UserMessage, OrderStatusHistory, Size, ProductSize
 from .forms import ProductForm, CategoryForm, SeasonForm, ProductSizeFormSet, UserForm, UserProfileForm
 
-@staff_member_required
-def admin_dashboard(request):
-    """Admin dashboard with statistics and overview"""
+_DASHBOARD_STATS_CACHE_KEY = 'admin:dashboard:stats'
+_DASHBOARD_STATS_TIMEOUT = 60
+
+def _dashboard_stats():
+    """Compute the dashboard's totals and chart data"""
     # Get statistics
     total_products = Product.objects.count()
     total_orders = Order.objects.count()
@@ -26,25 +30,30 @@ def admin_dashboard(request):
         status__in=['delivered', 'shipped']
     ).aggregate(total=Sum('total_amount'))['total'] or 0
     
-    # Recent orders
-    recent_orders = Order.objects.select_related('user').order_by('-created_at')[:5]
-    
-    # Low stock products (stock < 10)
-    low_stock_products = Product.objects.filter(stock__lt=10).order_by('stock')[:5]
-    
     # Sales data for chart (last 7 days)
     end_date = timezone.now().date()
     start_date = end_date - timedelta(days=6)
     
+    prev_week_start = start_date - timedelta(days=7)
+    prev_week_end = start_date - timedelta(days=1)
+    
+    # One grouped query covers this week and the previous one
+    daily_totals = dict(
+        Order.objects.filter(
+            created_at__date__range=[prev_week_start, end_date],
+            status__in=['delivered', 'shipped']
+        ).annotate(day=TruncDate('created_at'))
+        .values('day')
+        .annotate(total=Sum('total_amount'))
+        .values_list('day', 'total')
+    )
+    
     sales_data = []
     sales_labels = []
     
     for i in range(7):
         date = start_date + timedelta(days=i)
-        daily_sales = Order.objects.filter(
-            created_at__date=date,
-            status__in=['delivered', 'shipped']
-        ).aggregate(total=Sum('total_amount'))['total'] or 0
+        daily_sales = daily_totals.get(date) or 0
         
         sales_data.append(float(daily_sales))
         sales_labels.append(date.strftime('%b %d'))
@@ -66,25 +75,21 @@ def admin_dashboard(request):
     best_day_sales = max(sales_data) if sales_data else 0
     
     # Calculate sales growth (compare with previous week)
-    prev_week_start = start_date - timedelta(days=7)
-    prev_week_end = start_date - timedelta(days=1)
-    prev_week_sales = Order.objects.filter(
-        created_at__date__range=[prev_week_start, prev_week_end],
-        status__in=['delivered', 'shipped']
-    ).aggregate(total=Sum('total_amount'))['total'] or 0
+    prev_week_sales = sum(
+        daily_totals.get(prev_week_start + timedelta(days=i)) or 0
+        for i in range(7)
+    )
     
     if prev_week_sales > 0:
         sales_growth = ((total_week_sales - float(prev_week_sales)) / float(prev_week_sales)) * 100
     else:
         sales_growth = 100 if total_week_sales > 0 else 0
     
-    context = {
+    return {
         'total_products': total_products,
         'total_orders': total_orders,
         'total_users': total_users,
         'total_revenue': total_revenue,
-        'recent_orders': recent_orders,
-        'low_stock_products': low_stock_products,
         'sales_data': json.dumps(sales_data),
         'sales_labels': json.dumps(sales_labels),
         'order_status_data': json.dumps(order_status_data),
@@ -95,6 +100,24 @@ def admin_dashboard(request):
         'best_day_sales': best_day_sales,
         'sales_growth': sales_growth,
     }
+
+@staff_member_required
+def admin_dashboard(request):
+    """Admin dashboard with statistics and overview"""
+    # Totals and charts change slowly, so they are shared for a short while
+    stats = cache.get_or_set(_DASHBOARD_STATS_CACHE_KEY, _dashboard_stats, _DASHBOARD_STATS_TIMEOUT)
+    
+    # Recent orders
+    recent_orders = Order.objects.select_related('user').order_by('-created_at')[:5]
+    
+    # Low stock products (stock < 10)
+    low_stock_products = Product.objects.select_related('category').filter(stock__lt=10).order_by('stock')[:5]
+    
+    context = {
+        **stats,
+        'recent_orders': recent_orders,
+        'low_stock_products': low_stock_products,
+    }
     
     return render(request, 'admin/dashboard.html', context)
 
@@ -105,7 +128,11 @@ def admin_products(request):
     category_filter = request.GET.get('category', '')
     season_filter = request.GET.get('season', '')
     
-    products = Product.objects.select_related('category', 'season').all()
+    # Only the columns the product table shows
+    products = Product.objects.select_related('category', 'season').only(
+        'id', 'name', 'description', 'price', 'stock', 'image', 'featured', 'created_at',
+        'category__name', 'season__name'
+    )
     
     if search_query:
         products = products.filter(
@@ -219,7 +246,11 @@ def admin_orders(request):
     status_filter = request.GET.get('status', '')
     search_query = request.GET.get('search', '')
     
-    orders = Order.objects.select_related('user').all()
+    # Only the columns the order table shows
+    orders = Order.objects.select_related('user').prefetch_related('items').only(
+        'id', 'status', 'total_amount', 'payment_status', 'created_at',
+        'user__username', 'user__email', 'user__first_name', 'user__last_name'
+    )
     
     if status_filter:
         orders = orders.filter(status=status_filter)
@@ -234,21 +265,31 @@ def admin_orders(request):
     orders = orders.order_by('-created_at')
     
     # Calculate statistics from real data
-    all_orders = Order.objects.all()
-    total_orders = all_orders.count()
-    pending_orders = all_orders.filter(status='pending').count()
-    completed_orders = all_orders.filter(status='delivered').count()
-    total_revenue = all_orders.filter(status='delivered').aggregate(
-        total=Sum('total_amount')
-    )['total'] or 0
+    aggregates = {
+        'total': Count('id'),
+        'pending': Count('id', filter=Q(status='pending')),
+        'completed': Count('id', filter=Q(status='delivered')),
+        'revenue': Sum('total_amount', filter=Q(status='delivered')),
+    }
+    if status_filter:
+        aggregates['filtered'] = Count('id', filter=Q(status=status_filter))
+    stats = Order.objects.aggregate(**aggregates)
+    total_orders = stats['total']
+    pending_orders = stats['pending']
+    completed_orders = stats['completed']
+    total_revenue = stats['revenue'] or 0
     
     # Pagination
     paginator = Paginator(orders, 20)
+    # Unless a search narrows the listing, its row count is already in the
+    # statistics, so the paginator doesn't need a COUNT query of its own
+    if not search_query:
+        paginator.count = stats['filtered'] if status_filter else stats['total']
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
     # Get order statuses for filter
-    order_statuses = Order.objects.values_list('status', flat=True).distinct()
+    order_statuses = [status for status, label in Order.STATUS_CHOICES]
     
     context = {
         'orders': page_obj,
@@ -268,32 +309,32 @@ def admin_orders(request):
 @staff_member_required
 def admin_order_detail(request, pk):
     """Order detail and management"""
-    order = get_object_or_404(Order, pk=pk)
-    order_items = OrderItem.objects.filter(order=order).select_related('product')
-    status_history = OrderStatusHistory.objects.filter(order=order).order_by('-created_at')
+    order = get_object_or_404(Order.objects.select_related('user__userprofile'), pk=pk)
     
     if request.method == 'POST':
         # Handle payment status update for COD orders
         if 'payment_received' in request.POST:
             if order.payment_method == 'cash_on_delivery' and order.status == 'delivered' and not order.payment_status:
-                order.payment_status = True
-                order.save()
-                
-                # Create status history entry for payment received
-                OrderStatusHistory.objects.create(
-                    order=order,
-                    status=order.status,
-                    created_by=request.user,
-                    notes='Payment received for COD order'
-                )
-                
-                # Send notification to user
-                if order.user:
-                    UserMessage.objects.create(
-                        user=order.user,
-                        message=f'Payment for your order #{order.id} has been confirmed as received. Thank you!',
-                        level=messages.SUCCESS
+                # The order, its history entry and the notification commit together
+                with transaction.atomic():
+                    order.payment_status = True
+                    order.save()
+                    
+                    # Create status history entry for payment received
+                    OrderStatusHistory.objects.create(
+                        order=order,
+                        status=order.status,
+                        created_by=request.user,
+                        notes='Payment received for COD order'
                     )
+                    
+                    # Send notification to user
+                    if order.user:
+                        UserMessage.objects.create(
+                            user=order.user,
+                            message=f'Payment for your order #{order.id} has been confirmed as received. Thank you!',
+                            level=messages.SUCCESS
+                        )
                 
                 messages.success(request, 'Payment marked as received successfully')
                 return redirect('custom_admin:order_detail', pk=pk)
@@ -316,47 +357,57 @@ def admin_order_detail(request, pk):
             
             # Check if the transition is valid
             if new_status in valid_transitions.get(order.status, []):
-                old_status = order.status
-                order.status = new_status
-                order.save()
-                
-                # Create status history entry
-                OrderStatusHistory.objects.create(
-                    order=order,
-                    status=new_status,
-                    created_by=request.user,
-                    notes=request.POST.get('notes', '')
-                )
-                
-                # Send notification to user
-                if order.user:
-                    status_messages = {
-                        'confirmed': f'Your order #{order.id} has been confirmed and will be processed soon.',
-                        'processing': f'Your order #{order.id} is now being processed.',
-                        'packed': f'Your order #{order.id} has been packed and is ready for shipment.',
-                        'shipped': f'Your order #{order.id} has been shipped and is on its way to you.',
-                        'delivered': f'Your order #{order.id} has been delivered. Thank you for shopping with us!',
-                        'cancelled': f'Your order #{order.id} has been cancelled.'
-                    }
-                    
-                    message_text = status_messages.get(new_status, f'Your order #{order.id} status has been updated to {order.get_status_display()}.')
+                # The order, its history entry and the notification commit together
+                with transaction.atomic():
+                    old_status = order.status
+                    order.status = new_status
+                    order.save()
                     
-                    UserMessage.objects.create(
-                        user=order.user,
-                        message=message_text,
-                        level=messages.INFO if new_status != 'cancelled' else messages.WARNING
+                    # Create status history entry
+                    OrderStatusHistory.objects.create(
+                        order=order,
+                        status=new_status,
+                        created_by=request.user,
+                        notes=request.POST.get('notes', '')
                     )
+                    
+                    # Send notification to user
+                    if order.user:
+                        status_messages = {
+                            'confirmed': f'Your order #{order.id} has been confirmed and will be processed soon.',
+                            'processing': f'Your order #{order.id} is now being processed.',
+                            'packed': f'Your order #{order.id} has been packed and is ready for shipment.',
+                            'shipped': f'Your order #{order.id} has been shipped and is on its way to you.',
+                            'delivered': f'Your order #{order.id} has been delivered. Thank you for shopping with us!',
+                            'cancelled': f'Your order #{order.id} has been cancelled.'
+                        }
+                    
+                        message_text = status_messages.get(new_status, f'Your order #{order.id} status has been updated to {order.get_status_display()}.')
+                    
+                        UserMessage.objects.create(
+                            user=order.user,
+                            message=message_text,
+                            level=messages.INFO if new_status != 'cancelled' else messages.WARNING
+                        )
                 
                 messages.success(request, f'Order status updated to {new_status.title()}')
                 return redirect('custom_admin:order_detail', pk=pk)
             else:
-                messages.error(request, f'Invalid status transition from {order.get_status_display()} to {dict(Order.STATUS_CHOICES).get(new_status, new_status)}')
+                messages.error(request, f'Invalid status transition from {order.get_status_display()} to {Order.STATUS_DISPLAY.get(new_status, new_status)}')
                 return redirect('custom_admin:order_detail', pk=pk)
     
+    # Fill order.items and order.status_history once so the template's
+    # accessors all read the same prefetched rows
+    prefetch_related_objects(
+        [order],
+        Prefetch('items', queryset=OrderItem.objects.select_related('product__category', 'product__season')),
+        Prefetch('status_history', queryset=OrderStatusHistory.objects.select_related('created_by').order_by('-created_at')),
+    )
+    
     context = {
         'order': order,
-        'order_items': order_items,
-        'status_history': status_history,
+        'order_items': order.items.all(),
+        'status_history': order.status_history.all(),
         'status_choices': Order.STATUS_CHOICES,
     }
     
@@ -367,7 +418,15 @@ def admin_users(request):
     """User management page"""
     search_query = request.GET.get('search', '')
     
-    users = User.objects.filter(is_staff=False).select_related('userprofile')
+    # Only the columns the user table shows
+    users = User.objects.filter(is_staff=False).select_related('userprofile').only(
+        'id', 'username', 'email', 'first_name', 'last_name', 'is_active', 'is_staff',
+        'is_superuser', 'last_login', 'date_joined',
+        'userprofile__phone'
+    ).annotate(
+        order_count=Count('order'),
+        total_spent=Sum('order__total_amount', filter=Q(order__status__in=['delivered', 'shipped']))
+    )
     
     if search_query:
         users = users.filter(
@@ -380,19 +439,21 @@ def admin_users(request):
     users = users.order_by('-date_joined')
     
     # Calculate statistics
-    total_users = User.objects.filter(is_staff=False).count()
-    active_users = User.objects.filter(is_staff=False, is_active=True).count()
-    staff_users = User.objects.filter(is_staff=True).count()
-    
-    # New users this month
-    from datetime import datetime
-    current_month = datetime.now().month
-    current_year = datetime.now().year
-    new_users_this_month = User.objects.filter(
-        is_staff=False,
-        date_joined__month=current_month,
-        date_joined__year=current_year
-    ).count()
+    today = timezone.localdate()
+    stats = User.objects.aggregate(
+        total=Count('id', filter=Q(is_staff=False)),
+        active=Count('id', filter=Q(is_staff=False, is_active=True)),
+        staff=Count('id', filter=Q(is_staff=True)),
+        new_this_month=Count('id', filter=Q(
+            is_staff=False,
+            date_joined__month=today.month,
+            date_joined__year=today.year
+        )),
+    )
+    total_users = stats['total']
+    active_users = stats['active']
+    staff_users = stats['staff']
+    new_users_this_month = stats['new_this_month']
     
     # Pagination
     paginator = Paginator(users, 20)
@@ -453,17 +514,21 @@ def admin_user_add(request):
 @staff_member_required
 def admin_user_detail(request, pk):
     """User detail view"""
-    user = get_object_or_404(User, pk=pk)
+    # User statistics are annotated onto the user lookup itself
+    user = get_object_or_404(
+        User.objects.annotate(
+            order_count=Count('order'),
+            total_spent=Sum('order__total_amount', filter=Q(order__status__in=['delivered', 'shipped']))
+        ),
+        pk=pk
+    )
     
     # Get user's orders
     orders = Order.objects.filter(user=user).order_by('-created_at')[:10]
     
     # Calculate user statistics
-    total_orders = Order.objects.filter(user=user).count()
-    total_spent = Order.objects.filter(
-        user=user,
-        status__in=['delivered', 'shipped']
-    ).aggregate(total=Sum('total_amount'))['total'] or 0
+    total_orders = user.order_count
+    total_spent = user.total_spent or 0
     
     # Get user's cart items (Cart model doesn't have user field, so we'll skip this)
     cart_items = []
@@ -543,23 +608,17 @@ def admin_category_edit(request, pk):
 @staff_member_required
 def admin_seasons(request):
     """Season management page"""
-    seasons = Season.objects.all().order_by('name')
+    seasons = list(Season.objects.annotate(
+        product_count=Count('products')
+    ).order_by('name'))
     
-    # Calculate statistics
-    total_seasons = seasons.count()
-    active_seasons = seasons.filter(products__isnull=False).distinct().count()
-    products_with_seasons = Product.objects.filter(season__isnull=False).count()
-    
-    # For current season, we'll use the season with most recent products
-    # or you can define logic based on actual current season
-    current_season_products = 0
-    if seasons.exists():
-        # Get the season with the most products as "current"
-        current_season = seasons.annotate(
-            product_count=Count('products')
-        ).order_by('-product_count').first()
-        if current_season:
-            current_season_products = current_season.products.count()
+    # Calculate statistics from the annotated seasons
+    total_seasons = len(seasons)
+    active_seasons = sum(1 for season in seasons if season.product_count)
+    products_with_seasons = sum(season.product_count for season in seasons)
+    
+    # The season with the most products is treated as "current"
+    current_season_products = max((season.product_count for season in seasons), default=0)
     
     context = {
         'seasons': seasons,
@@ -647,35 +706,56 @@ def admin_messages(request):
 def admin_analytics(request):
     """Analytics and reports page"""
     # Monthly sales data
+    today = timezone.now().date()
+    month_starts = []
+    for i in range(12):
+        # Step back whole calendar months so none is skipped or repeated
+        year, month = divmod(today.year * 12 + today.month - 1 - i, 12)
+        month_starts.append(date(year, month + 1, 1))
+    
+    # One grouped query covers all twelve months
+    monthly_totals = dict(
+        Order.objects.filter(
+            created_at__date__gte=month_starts[-1],
+            created_at__date__lte=today,
+            status__in=['delivered', 'shipped']
+        ).annotate(month=TruncMonth('created_at', output_field=DateField()))
+        .values('month')
+        .annotate(total=Sum('total_amount'))
+        .values_list('month', 'total')
+    )
+    
     monthly_sales = []
     monthly_labels = []
     
-    for i in range(12):
-        date = timezone.now().date().replace(day=1) - timedelta(days=30*i)
-        month_start = date.replace(day=1)
-        if i == 0:
-            month_end = timezone.now().date()
-        else:
-            month_end = (month_start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
-        
-        monthly_total = Order.objects.filter(
-            created_at__date__gte=month_start,
-            created_at__date__lte=month_end,
-            status__in=['delivered', 'shipped']
-        ).aggregate(total=Sum('total_amount'))['total'] or 0
+    for month_start in month_starts:
+        monthly_total = monthly_totals.get(month_start) or 0
         
         monthly_sales.insert(0, float(monthly_total))
         monthly_labels.insert(0, month_start.strftime('%b %Y'))
     
+    # Top selling products and category sales count only completed sales in the chart's window
+    sold_in_window = Q(
+        orderitem__order__status__in=['delivered', 'shipped'],
+        orderitem__order__created_at__date__gte=month_starts[-1]
+    )
+    
     # Top selling products
-    top_products = Product.objects.annotate(
-        total_sold=Sum('orderitem__quantity')
-    ).filter(total_sold__isnull=False).order_by('-total_sold')[:10]
+    top_products = Product.objects.select_related('category').annotate(
+        total_sold=Sum('orderitem__quantity', filter=sold_in_window),
+        total_revenue=Sum(F('orderitem__price') * F('orderitem__quantity'), filter=sold_in_window)
+    ).filter(total_sold__gt=0).order_by('-total_sold')[:10]
     
-    # Category wise sales
+    # Category wise sales, summed from item lines so an order is not counted once per item
     category_sales = Category.objects.annotate(
-        total_sales=Sum('products__orderitem__order__total_amount')
-    ).filter(total_sales__isnull=False).order_by('-total_sales')[:5]
+        total_sales=Sum(
+            F('products__orderitem__price') * F('products__orderitem__quantity'),
+            filter=Q(
+                products__orderitem__order__status__in=['delivered', 'shipped'],
+                products__orderitem__order__created_at__date__gte=month_starts[-1]
+            )
+        )
+    ).filter(total_sales__gt=0).order_by('-total_sales')[:5]
     
     context = {
         'monthly_sales': json.dumps(monthly_sales),
@@ -696,7 +776,7 @@ def admin_send_order_email(request, pk):
             # Prepare email context
             context = {
                 'order': order,
-                'order_items': order.orderitem_set.all(),
+                'order_items': order.items.select_related('product__category', 'product__season'),
                 'site_name': 'FashionHub',
             }
             
@@ -726,7 +806,7 @@ def admin_send_order_email(request, pk):
 def admin_order_invoice(request, pk):
     """Generate and display order invoice"""
     order = get_object_or_404(Order, pk=pk)
-    order_items = order.items.all()
+    order_items = order.items.select_related('product__category', 'product__season')
     
     context = {
         'order': order,
@@ -739,52 +819,69 @@ def admin_order_invoice(request, pk):
     
     return render(request, 'admin/invoice.html', context)
 
+class _Echo:
+    """File-like object whose write() hands the csv module's output straight back"""
+
+    def write(self, value):
+        return value
+
 @staff_member_required
 def admin_export_order(request, pk):
     """Export order data as CSV"""
     order = get_object_or_404(Order, pk=pk)
-    order_items = order.orderitem_set.all()
-    
-    response = HttpResponse(content_type='text/csv')
+    order_items = order.items.select_related('product__category')
+    
+    writer = csv.writer(_Echo())
+    
+    def rows():
+        # Write order header
+        yield writer.writerow(['Order Export - FashionHub'])
+        yield writer.writerow(['Order ID', order.id])
+        yield writer.writerow(['Customer', order.full_name])
+        yield writer.writerow(['Email', order.email])
+        yield writer.writerow(['Phone', order.phone])
+        yield writer.writerow(['Order Date', order.created_at.strftime('%Y-%m-%d %H:%M:%S')])
+        yield writer.writerow(['Status', order.get_status_display()])
+        yield writer.writerow(['Total Amount', f'Rs.{order.total_amount}'])
+        yield writer.writerow([])
+        
+        # Write shipping address
+        yield writer.writerow(['Shipping Address'])
+        yield writer.writerow(['Address', order.address])
+        yield writer.writerow(['City', order.city])
+        yield writer.writerow(['State', order.state])
+        yield writer.writerow(['Postal Code', order.postal_code])
+        yield writer.writerow([])
+        
+        # Write order items header
+        yield writer.writerow(['Order Items'])
+        yield writer.writerow(['Product Name', 'Category', 'Price', 'Quantity', 'Total'])
+        
+        # Write order items, streamed from the database as they are sent
+        for item in order_items.iterator():
+            yield writer.writerow([
+                item.product_name,
+                item.product.category.name if item.product else '',
+                f'Rs.{item.price}',
+                item.quantity,
+                f'Rs.{item.subtotal}'
+            ])
+    
+    response = StreamingHttpResponse(rows(), content_type='text/csv')
     response['Content-Disposition'] = f'attachment; filename="order_{order.id}_export.csv"'
-    
-    writer = csv.writer(response)
-    
-    # Write order header
-    writer.writerow(['Order Export - FashionHub'])
-    writer.writerow(['Order ID', order.id])
-    writer.writerow(['Customer', order.full_name])
-    writer.writerow(['Email', order.email])
-    writer.writerow(['Phone', order.phone])
-    writer.writerow(['Order Date', order.created_at.strftime('%Y-%m-%d %H:%M:%S')])
-    writer.writerow(['Status', order.get_status_display()])
-    writer.writerow(['Total Amount', f'Rs.{order.total_amount}'])
-    writer.writerow([])
-    
-    # Write shipping address
-    writer.writerow(['Shipping Address'])
-    writer.writerow(['Address', order.address])
-    writer.writerow(['City', order.city])
-    writer.writerow(['State', order.state])
-    writer.writerow(['Postal Code', order.postal_code])
-    writer.writerow([])
-    
-    # Write order items header
-    writer.writerow(['Order Items'])
-    writer.writerow(['Product Name', 'Category', 'Price', 'Quantity', 'Total'])
-    
-    # Write order items
-    for item in order_items:
-        writer.writerow([
-            item.product.name,
-            item.product.category.name,
-            f'Rs.{item.price}',
-            item.quantity,
-            f'Rs.{item.get_total()}'
-        ])
-    
     return response
 
+# Order detail page actions served by the single orders/<pk>/<action>/ route
+_ORDER_ACTIONS = {
+    'send-email': admin_send_order_email,
+    'invoice': admin_order_invoice,
+    'export': admin_export_order,
+}
+
+@staff_member_required
+def admin_order_action(request, pk, action):
+    """Dispatch an order detail page action to its view"""
+    return _ORDER_ACTIONS[action](request, pk)
 
 
 @staff_member_required
@@ -839,10 +936,12 @@ def admin_profile(request):
         profile_form = UserProfileForm(instance=user_profile)
     
     # Get user statistics
-    total_orders = Order.objects.filter(user=user).count()
-    total_spent = Order.objects.filter(user=user, status='delivered').aggregate(
-        total=Sum('total_amount')
-    )['total'] or 0
+    stats = Order.objects.filter(user=user).aggregate(
+        count=Count('id'),
+        total=Sum('total_amount', filter=Q(status='delivered'))
+    )
+    total_orders = stats['count']
+    total_spent = stats['total'] or 0
     
     # Get recent orders
     recent_orders = Order.objects.filter(user=user).order_by('-created_at')[:5]
@@ -4,3 +4,13 @@ from django.apps import AppConfig
 class StoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'store'
+
+    def ready(self):
+        # Build the URL resolvers' pattern and reverse caches at startup so the
+        # first request after a restart doesn't pay for compiling every route
+        from django.urls import get_resolver
+
+        resolver = get_resolver()
+        resolver.reverse_dict
+        for _prefix, namespace_resolver in resolver.namespace_dict.values():
+            namespace_resolver.reverse_dict
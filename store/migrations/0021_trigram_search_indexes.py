@@ -0,0 +1,41 @@
+from django.db import migrations
+
+
+# Admin search uses icontains, which PostgreSQL runs as UPPER(col) LIKE UPPER('%term%'),
+# so the trigram indexes are built on UPPER(col) for the planner to match them.
+TRIGRAM_INDEXES = [
+    ('store_order_full_name_trgm', 'store_order', 'full_name'),
+    ('store_order_email_trgm', 'store_order', 'email'),
+    ('store_product_name_trgm', 'store_product', 'name'),
+    ('store_product_description_trgm', 'store_product', 'description'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS {} ON {} USING gin (UPPER({}) gin_trgm_ops)'.format(
+                schema_editor.quote_name(name), schema_editor.quote_name(table), schema_editor.quote_name(column)
+            )
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute('DROP INDEX IF EXISTS {}'.format(schema_editor.quote_name(name)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0020_alter_order_created_at_alter_order_payment_status_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
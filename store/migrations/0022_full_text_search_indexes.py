@@ -0,0 +1,41 @@
+from django.db import migrations
+
+
+# Must match the SQL FullTextSearchMixin's SearchVector compiles to, so each
+# column is COALESCEd and the columns are joined with ' ' in the same order.
+SEARCH_INDEXES = [
+    ('store_product_search_vector', 'store_product', ['name', 'description', 'tags']),
+    ('store_contactmessage_search_vector', 'store_contactmessage', ['name', 'email', 'subject', 'message']),
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, columns in SEARCH_INDEXES:
+        document = " || ' ' || ".join(
+            "COALESCE({}, '')".format(schema_editor.quote_name(column)) for column in columns
+        )
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS {} ON {} USING gin (to_tsvector('english'::regconfig, {}))".format(
+                schema_editor.quote_name(name), schema_editor.quote_name(table), document
+            )
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, columns in SEARCH_INDEXES:
+        schema_editor.execute('DROP INDEX IF EXISTS {}'.format(schema_editor.quote_name(name)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0021_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.db import migrations
+
+
+# auth.User isn't ours to add Meta.indexes to, so the index backing the admin's
+# newest-first user list (ordering by -date_joined, then -pk) is created here.
+INDEX_NAME = 'store_user_date_joined_idx'
+
+
+def create_date_joined_index(apps, schema_editor):
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    schema_editor.execute('CREATE INDEX IF NOT EXISTS {} ON {} ({}, {})'.format(
+        schema_editor.quote_name(INDEX_NAME),
+        schema_editor.quote_name(User._meta.db_table),
+        schema_editor.quote_name(User._meta.get_field('date_joined').column),
+        schema_editor.quote_name(User._meta.pk.column),
+    ))
+
+
+def drop_date_joined_index(apps, schema_editor):
+    schema_editor.execute('DROP INDEX IF EXISTS {}'.format(schema_editor.quote_name(INDEX_NAME)))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0022_full_text_search_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(create_date_joined_index, drop_date_joined_index),
+    ]
@@ -10,7 +10,7 @@ from django.dispatch import receiver
 from django.contrib.messages import constants as message_constants
 from django.contrib.messages.storage.fallback import FallbackStorage
 from django.contrib import messages
-from django.db.models import Avg
+from django.db.models import Avg, F, Sum
 
 # Create your models here.
 
@@ -225,6 +225,10 @@ class Order(models.Model):
         ('esewa', 'eSewa'),
         ('bank_transfer', 'Bank Transfer')
     ]
+    
+    # Lookup maps built once at class creation rather than on every display call
+    STATUS_DISPLAY = dict(STATUS_CHOICES)
+    PAYMENT_DISPLAY = dict(PAYMENT_CHOICES)
 
     user = models.ForeignKey(User, on_delete=models.SET_NULL, null=True)
     # Shipping Information
@@ -244,9 +248,9 @@ class Order(models.Model):
     total_amount = models.DecimalField(max_digits=10, decimal_places=2)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     payment_method = models.CharField(max_length=20, choices=PAYMENT_CHOICES, default='cash_on_delivery')
-    payment_status = models.BooleanField(default=False)
+    payment_status = models.BooleanField(default=False, db_index=True)
     order_notes = models.TextField(blank=True)
-    created_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     cancellation_reason = models.TextField(blank=True, null=True)
     is_received = models.BooleanField(default=False, help_text="Indicates if the customer has confirmed receipt of the order")
@@ -257,14 +261,18 @@ class Order(models.Model):
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['user', '-created_at']),
+        ]
         
     def get_status_display(self):
         """Return the human-readable status"""
-        return dict(self.STATUS_CHOICES).get(self.status, self.status)
+        return self.STATUS_DISPLAY.get(self.status, self.status)
         
     def get_payment_method_display(self):
         """Return the human-readable payment method"""
-        return dict(self.PAYMENT_CHOICES).get(self.payment_method, self.payment_method)
+        return self.PAYMENT_DISPLAY.get(self.payment_method, self.payment_method)
         
     @property
     def can_cancel(self):
@@ -303,13 +311,16 @@ class OrderStatusHistory(models.Model):
     class Meta:
         ordering = ['-created_at']
         verbose_name_plural = "Order status history"
+        indexes = [
+            models.Index(fields=['order', 'created_at']),
+        ]
     
     def __str__(self):
         return f"Order #{self.order.id} changed to {self.get_status_display()}"
     
     def get_status_display(self):
         """Return the human-readable status"""
-        return dict(Order.STATUS_CHOICES).get(self.status, self.status)
+        return Order.STATUS_DISPLAY.get(self.status, self.status)
 
 # We'll keep Cart and CartItem models for the shopping cart functionality,
 # but they won't be exposed in the admin interface
@@ -387,10 +398,14 @@ def notify_user_on_order_delete(sender, instance, **kwargs):
         
         # Return items to inventory if order was deleted and not already cancelled
         if instance.status != 'cancelled':
-            for item in instance.items.all():
-                if item.product:
-                    item.product.stock += item.quantity
-                    item.product.save()
+            quantities = (
+                instance.items.filter(product__isnull=False)
+                .values('product').annotate(quantity=Sum('quantity'))
+            )
+            for row in quantities:
+                Product.objects.filter(pk=row['product']).update(
+                    stock=F('stock') + row['quantity'], updated_at=timezone.now()
+                )
 
 
 class ContactMessage(models.Model):
@@ -5,4 +5,47 @@ register = template.Library()
 @register.filter(name='get_item')
 def get_item(dictionary, key):
     """Access dictionary values by key in Django templates"""
-    return dictionary.get(key, '') 
\ No newline at end of file
+    return dictionary.get(key, '') 
+
+
+# Sidebar section of each custom admin URL name
+_ADMIN_SECTIONS = {
+    'dashboard': 'dashboard',
+    'orders': 'orders',
+    'orders_slashless': 'orders',
+    'order_detail': 'orders',
+    'order_action': 'orders',
+    'products': 'products',
+    'products_slashless': 'products',
+    'product_add': 'products',
+    'product_edit': 'products',
+    'product_delete': 'products',
+    'messages': 'messages',
+    'messages_slashless': 'messages',
+    'users': 'users',
+    'users_slashless': 'users',
+    'add_user': 'users',
+    'user_detail': 'users',
+    'user_edit': 'users',
+    'analytics': 'analytics',
+    'analytics_slashless': 'analytics',
+    'profile': 'profile',
+    'profile_slashless': 'profile',
+    'categories': 'categories',
+    'categories_slashless': 'categories',
+    'category_add': 'categories',
+    'category_edit': 'categories',
+    'seasons': 'seasons',
+    'seasons_slashless': 'seasons',
+    'season_add': 'seasons',
+    'season_edit': 'seasons',
+    'season_delete': 'seasons',
+}
+
+@register.simple_tag(takes_context=True)
+def admin_section(context):
+    """Name the custom admin section of the current page, for highlighting the sidebar link"""
+    match = getattr(context.get('request'), 'resolver_match', None)
+    if match is None or 'custom_admin' not in match.namespaces:
+        return ''
+    return _ADMIN_SECTIONS.get(match.url_name, '')
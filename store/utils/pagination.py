@@ -0,0 +1,39 @@
+"""Paginators for large admin changelists"""
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Paginator that avoids a full COUNT(*) on unfiltered PostgreSQL tables
+    
+    The planner's row estimate from pg_class is used instead once the table is
+    large enough for the exact count to matter. Filtered querysets, small tables
+    and other database backends fall back to the regular exact count.
+    """
+    
+    ESTIMATE_THRESHOLD = 10000
+    
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return super().count
+        
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+        
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::BIGINT FROM pg_class WHERE relname = %s",
+                [self.object_list.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+        
+        # reltuples is -1 (or missing) until the table has been analyzed
+        if not row or row[0] < self.ESTIMATE_THRESHOLD:
+            return super().count
+        return row[0]